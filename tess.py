@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 import curses
+import os
+import re
+import sys
+import time
 import chess
 import chess.pgn
 import requests
+from requests.adapters import HTTPAdapter
+from collections import namedtuple
+from functools import lru_cache
 from io import StringIO
+from itertools import groupby, islice
 
 # Example ASCII "shapes" for each piece. 
 ASCII_PIECES = {
@@ -70,132 +78,460 @@ ASCII_PIECES = {
     ],
 }
 
-def init_colors():
-    curses.start_color()
-    curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_MAGENTA)  # Pink squares
-    curses.init_pair(2, curses.COLOR_BLACK, curses.COLOR_YELLOW)   # Yellow squares
+# ASCII_PIECES pre-encoded and measured once at import time.
+PieceGlyph = namedtuple("PieceGlyph", "rows height width")
+GLYPHS = {
+    piece_char: PieceGlyph(
+        tuple(line.encode() for line in shape),
+        len(shape),
+        max(len(line) for line in shape)
+    )
+    for piece_char, shape in ASCII_PIECES.items()
+}
 
-def draw_piece_ascii(stdscr, piece_char, x, y, cell_width, cell_height, bg_color):
+@lru_cache(maxsize=32)
+def clip_glyph(piece_char, cell_width, cell_height):
     """
-    Draws ASCII art for a given piece in a cell at (x, y).
+    Centers a piece's glyph in a cell of the given size and returns
+    (offset_x, offset_y, rows) with the rows clipped to the cell.
     """
-    shape = ASCII_PIECES.get(piece_char)
-    if not shape:
-        return
-    shape_height = len(shape)
-    shape_width = max(len(line) for line in shape)
-    offset_y = (cell_height - shape_height) // 2
-    offset_x = (cell_width - shape_width) // 2
-    for row_idx, row_text in enumerate(shape):
-        if 0 <= offset_y + row_idx < cell_height:
-            clipped = row_text[:cell_width]
-            stdscr.addstr(
-                y + offset_y + row_idx,
-                x + offset_x,
-                clipped,
-                bg_color
-            )
-
-def draw_board_common(stdscr, board, cell_width, cell_height):
+    glyph = GLYPHS[piece_char]
+    offset_y = (cell_height - glyph.height) // 2
+    offset_x = max(0, (cell_width - glyph.width) // 2)
+    skipped = max(0, -offset_y)
+    rows = tuple(
+        row[:cell_width - offset_x]
+        for row in glyph.rows[skipped:cell_height - offset_y]
+    )
+    return offset_x, offset_y + skipped, rows
+
+# Terminals known to honour DEC private mode 2026 (synchronized output).
+SYNC_OUTPUT_TERMS = ("xterm", "tmux", "wezterm", "kitty", "alacritty")
+SYNC_OUTPUT = os.environ.get("TERM", "").startswith(SYNC_OUTPUT_TERMS)
+
+def begin_frame():
     """
-    A helper that draws the board and returns the (prompt_y) row
-    we should write prompts at. 
+    Asks the terminal to hold back repainting until end_frame(),
+    so a redraw never shows up half-drawn. The escape is queued in
+    curses' output buffer and goes out in the same write as the frame.
     """
-    stdscr.clear()
-    height, width = stdscr.getmaxyx()
+    if SYNC_OUTPUT:
+        curses.putp(b"\x1b[?2026h")
 
-    # Validate that the board can fit.
-    required_width = 8 * cell_width + 4
-    required_height = 8 * cell_height + 4
-    if height < required_height or width < required_width:
-        stdscr.addstr(0, 0, "Window too small to draw the chessboard.")
-        stdscr.refresh()
-        return -1
+def end_frame():
+    if SYNC_OUTPUT:
+        os.write(sys.stdout.fileno(), b"\x1b[?2026l")
+
+# When the last frame reached the terminal, see wait_for_resize_to_settle()
+LAST_FRAME_TIME = 0.0
+
+def refresh_frame(stdscr):
+    """
+    Flushes the frame started by draw_board_common to the terminal.
+    Leave the cursor where input is read next, so that getch() has
+    nothing left to refresh.
+    """
+    global LAST_FRAME_TIME
+    stdscr.noutrefresh()
+    curses.doupdate()
+    end_frame()
+    LAST_FRAME_TIME = time.monotonic()
+
+# Everything about the layout that only changes when the terminal does.
+Geometry = namedtuple(
+    "Geometry",
+    "height width cell_width cell_height frame_width frame_height "
+    "background attr_runs pad"
+)
+
+def build_background(cell_width, cell_height):
+    """
+    Lays out everything on the board that doesn't depend on the position:
+    the rank/file labels as byte rows, and for every row the runs of
+    (x, length, attribute) making up the checkerboard.
+    """
+    frame_width = 8 * cell_width + 3
+    frame_height = 8 * cell_height + 3
+    row_chars = [bytearray(b' ' * frame_width) for _ in range(frame_height)]
+    row_attrs = [[curses.A_NORMAL] * frame_width for _ in range(frame_height)]
 
-    # Draw squares
     for row in range(8):
         for col in range(8):
             x = col * cell_width + 3  # offset for file labels
             y = row * cell_height + 1 # offset for rank labels
-            piece = board.piece_at(chess.square(col, 7 - row))
             # Checkerboard colors
-            if (row + col) % 2 == 0:
-                bg_color = curses.color_pair(2)  # Yellow
-            else:
-                bg_color = curses.color_pair(1)  # Pink
-
-            # Fill entire cell with background color
+            bg_color = CELL_BG[row * 8 + col]
             for h_offset in range(cell_height):
-                stdscr.addstr(y + h_offset, x, ' ' * cell_width, bg_color)
-
-            # If there's a piece, draw it
-            if piece:
-                draw_piece_ascii(
-                    stdscr, piece.symbol(),
-                    x, y,
-                    cell_width, cell_height,
-                    bg_color
-                )
-
-    # Draw rank indicators on the left (8..1)
+                row_attrs[y + h_offset][x:x + cell_width] = [bg_color] * cell_width
+
+    # Rank indicators on the left (8..1)
     for row in range(8):
-        stdscr.addstr(row * cell_height + 1, 1, str(8 - row))
-    # Draw file indicators (A..H) at the bottom
+        row_chars[row * cell_height + 1][1] = ord('8') - row
+    # File indicators (A..H) at the bottom
     for col in range(8):
-        stdscr.addstr(8 * cell_height + 2, col * cell_width + 3, chr(ord('A') + col))
+        row_chars[8 * cell_height + 2][col * cell_width + 3] = ord('A') + col
+
+    attr_runs = []
+    for attrs in row_attrs:
+        runs = []
+        x = 0
+        for attr, run in groupby(attrs):
+            run_length = sum(1 for _ in run)
+            runs.append((x, run_length, attr))
+            x += run_length
+        attr_runs.append(tuple(runs))
+    return tuple(bytes(chars) for chars in row_chars), tuple(attr_runs)
+
+def compute_geometry(stdscr, cell_width=None, cell_height=None):
+    """
+    Measures the terminal and derives the board layout from it.
+    Cell sizes that are given explicitly are kept as they are.
+    The board itself is drawn into an off-screen pad sized to fit it.
+    Must be called after init_colors().
+    """
+    height, width = stdscr.getmaxyx()
+    if cell_width is None:
+        cell_width = max(3, (width - 4) // 8)
+    if cell_height is None:
+        # Leave room for the label row and the prompt, input and message rows
+        cell_height = max(3, (height - 7) // 8)
+    frame_width = 8 * cell_width + 3
+    frame_height = 8 * cell_height + 3
+    # One spare row and column so writing the last cell doesn't fail
+    pad = curses.newpad(frame_height + 1, frame_width + 1)
+    # Keys can also be read through the pad, see wait_for_resize_to_settle()
+    pad.keypad(True)
+    return Geometry(
+        height, width,
+        cell_width, cell_height,
+        frame_width, frame_height,
+        *build_background(cell_width, cell_height),
+        pad
+    )
+
+# Background attribute of every cell, indexed by row * 8 + col;
+# filled in by init_colors()
+CELL_BG = (curses.A_NORMAL,) * 64
 
-    # Return a row for prompt usage
+def init_colors():
+    global CELL_BG
+    curses.start_color()
+    curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_MAGENTA)  # Pink squares
+    curses.init_pair(2, curses.COLOR_BLACK, curses.COLOR_YELLOW)   # Yellow squares
+    pair_pink = curses.color_pair(1)
+    pair_yellow = curses.color_pair(2)
+    CELL_BG = tuple(
+        pair_yellow if (row + col) & 1 == 0 else pair_pink
+        for row in range(8) for col in range(8)
+    )
+
+def draw_piece_ascii(row_chars, piece_char, x, y, cell_width, cell_height):
+    """
+    Writes ASCII art for a given piece into the frame buffer rows,
+    centered in the cell at (x, y).
+    """
+    if piece_char not in GLYPHS:
+        return
+    offset_x, offset_y, rows = clip_glyph(piece_char, cell_width, cell_height)
+    start = x + offset_x
+    for row_idx, clipped in enumerate(rows):
+        row_chars[y + offset_y + row_idx][start:start + len(clipped)] = clipped
+
+def changed_squares(piece_map, prev_piece_map):
+    """
+    Returns the squares whose piece differs between the two piece maps,
+    or None if there is nothing to compare against yet. Only occupied
+    squares are looked at, not all 64.
+    """
+    if prev_piece_map is None:
+        return None
+    return {
+        sq for sq in piece_map.keys() | prev_piece_map.keys()
+        if piece_map.get(sq) != prev_piece_map.get(sq)
+    }
+
+@lru_cache(maxsize=32)
+def cell_rows(piece_char, cell_width, cell_height):
+    """
+    Returns the finished rows of a cell showing piece_char (None for an
+    empty square), each ready to be written with a single addstr.
+    """
+    rows = [bytearray(b' ' * cell_width) for _ in range(cell_height)]
+    if piece_char is not None:
+        draw_piece_ascii(rows, piece_char, 0, 0, cell_width, cell_height)
+    return tuple(bytes(row) for row in rows)
+
+def redraw_square(pad, board, sq, geom):
+    """
+    Repaints a single cell (background and piece) in place.
+    """
+    col = chess.square_file(sq)
+    row = 7 - chess.square_rank(sq)
+    x = col * geom.cell_width + 3
+    y = row * geom.cell_height + 1
+    bg_color = CELL_BG[row * 8 + col]
+
+    piece = board.piece_at(sq)
+    rows = cell_rows(
+        piece.symbol() if piece else None,
+        geom.cell_width, geom.cell_height
+    )
+    for h_offset, cell_row in enumerate(rows):
+        pad.addstr(y + h_offset, x, cell_row, bg_color)
+
+try:
+    # Compiled drop-in for draw_frame, see tess_render.pyx
+    from tess_render import draw_frame
+except ImportError:
+    def draw_frame(pad, background, attr_runs, placements):
+        """
+        Writes a whole board into the pad: a copy of the background rows with
+        every (x, y, clipped glyph) of placements on top, emitted as the
+        prebuilt runs of equal attributes.
+        """
+        row_chars = [bytearray(chars) for chars in background]
+        for x, y, (offset_x, offset_y, rows) in placements:
+            start = x + offset_x
+            for row_idx, clipped in enumerate(rows):
+                row_chars[y + offset_y + row_idx][start:start + len(clipped)] = clipped
+
+        for y, (chars, runs) in enumerate(zip(row_chars, attr_runs)):
+            for x, run_length, attr in runs:
+                pad.addstr(y, x, bytes(chars[x:x + run_length]), attr)
+
+def draw_board_common(stdscr, board, geom, squares=None):
+    """
+    A helper that draws the board and returns the (prompt_y) row
+    we should write prompts at. 
+
+    If squares is given, only those cells are repainted on top of the
+    previous frame; otherwise the whole screen is redrawn.
+
+    The board goes into geom.pad and stdscr only keeps the prompt rows;
+    both reach the terminal together on the next refresh_frame().
+    """
+    begin_frame()
+    pad = geom.pad
+    cell_width = geom.cell_width
+    cell_height = geom.cell_height
     prompt_y = 8 * cell_height + 4
+    board_view = (0, 0, 0, 0, geom.frame_height - 1, geom.frame_width - 1)
+
+    if squares is not None:
+        for sq in squares:
+            redraw_square(pad, board, sq, geom)
+        pad.noutrefresh(*board_view)
+        # Wipe prompts and messages left over from the previous frame
+        stdscr.move(prompt_y, 0)
+        stdscr.clrtobot()
+        return prompt_y
+
+    stdscr.clear()
+
+    # Validate that the board and the prompt rows below it can fit.
+    if geom.height < prompt_y + 3 or geom.width < geom.frame_width + 1:
+        stdscr.addstr(0, 0, "Window too small to draw the chessboard.")
+        refresh_frame(stdscr)
+        return -1
+    stdscr.noutrefresh()
+
+    # Place pieces, visiting only the occupied squares
+    placements = []
+    for sq, piece in board.piece_map().items():
+        col = chess.square_file(sq)
+        row = 7 - chess.square_rank(sq)
+        placements.append((
+            col * cell_width + 3,  # offset for file labels
+            row * cell_height + 1, # offset for rank labels
+            clip_glyph(piece.symbol(), cell_width, cell_height)
+        ))
+
+    draw_frame(pad, geom.background, geom.attr_runs, placements)
+    pad.noutrefresh(*board_view)
+
+    # Return a row for prompt usage
     return prompt_y
 
+# A terminal being dragged sends a burst of resizes. Redraw for them at
+# most ~30 times a second, and right away once they pause this long.
+MIN_FRAME_INTERVAL = 1 / 30
+RESIZE_SETTLE_MS = 32
+
+def wait_for_resize_to_settle(pad):
+    """
+    Swallows further KEY_RESIZE events until MIN_FRAME_INTERVAL has passed
+    since the last frame, or none has arrived for RESIZE_SETTLE_MS.
+    Any other key read meanwhile is put back.
+
+    Reads through the board pad: getch() on stdscr would refresh it after
+    every resize, clearing the terminal between frames; pads never are.
+    """
+    pad.timeout(RESIZE_SETTLE_MS)
+    try:
+        while time.monotonic() - LAST_FRAME_TIME < MIN_FRAME_INTERVAL:
+            key = pad.getch()
+            if key != curses.KEY_RESIZE:
+                if key != -1:
+                    curses.ungetch(key)
+                break
+    finally:
+        pad.timeout(-1)
+
+def wait_for_resize(pad):
+    """
+    Ignores keys until the terminal is resized again, then lets the
+    resize settle. Used while the board doesn't fit.
+    """
+    while pad.getch() != curses.KEY_RESIZE:
+        pass
+    wait_for_resize_to_settle(pad)
+
+# Cheap sanity check run before board.parse_san(): only characters and
+# lengths that can occur in SAN, long algebraic or castling notation.
+MOVE_SHAPE = re.compile(r"[a-h1-8NBRQKnrqkxO0=+#-]{2,8}")
+
+def set_cursor(visibility):
+    """
+    curses.curs_set() that tolerates terminals unable to hide the cursor.
+    """
+    try:
+        curses.curs_set(visibility)
+    except curses.error:
+        pass
+
+def read_move(stdscr, y, geom, typed=""):
+    """
+    Reads a line of input at row y, echoing it as it is typed.
+    Expects the cursor at the start of that (empty) row already;
+    typed is text carried over from an interrupted read and is shown first.
+    Input stops growing one column short of the terminal width.
+
+    Returns (line, resized). If the terminal was resized before Enter
+    was pressed, resized is True and line holds what was typed so far.
+
+    The cursor is only shown while typing; it stays hidden otherwise.
+    """
+    max_len = geom.width - 1
+    chars = list(typed[:max_len])
+    if chars:
+        stdscr.addstr(y, 0, "".join(chars))
+    set_cursor(1)
+    try:
+        while True:
+            key = stdscr.getch()
+            if key == curses.KEY_RESIZE:
+                wait_for_resize_to_settle(geom.pad)
+                return "".join(chars), True
+            if key in (curses.KEY_ENTER, 10, 13):
+                return "".join(chars), False
+            if key in (curses.KEY_BACKSPACE, 127, 8):
+                if chars:
+                    chars.pop()
+                    stdscr.move(y, len(chars))
+                    stdscr.clrtoeol()
+            elif 32 <= key < 127 and len(chars) < max_len:
+                chars.append(chr(key))
+                stdscr.addch(key)
+    finally:
+        set_cursor(0)
+
+def draw_position(stdscr, board, geom, prev_piece_map, prompt):
+    """
+    Brings the screen up to date with board, shows prompt above the
+    input row and flushes the frame. Only squares that differ from
+    prev_piece_map are repainted.
+
+    Returns (prompt_y, piece_map) where piece_map is what the board now
+    shows; prompt_y is negative if the board didn't fit.
+    """
+    piece_map = board.piece_map()
+    prompt_y = draw_board_common(
+        stdscr, board, geom, changed_squares(piece_map, prev_piece_map))
+    if prompt_y >= 0:
+        stdscr.addstr(prompt_y, 0, prompt)
+        stdscr.clrtoeol()
+        stdscr.move(prompt_y + 1, 0)
+        refresh_frame(stdscr)
+    return prompt_y, piece_map
+
+def show_message(stdscr, y, geom, text):
+    """
+    Shows text at row y and waits for any key, which is returned.
+    """
+    stdscr.addstr(y, 0, text)
+    refresh_frame(stdscr)
+    key = stdscr.getch()
+    if key == curses.KEY_RESIZE:
+        wait_for_resize_to_settle(geom.pad)
+    return key
+
 def draw_standard_game(stdscr, board, cell_width=None, cell_height=None):
     """
     Original TUI loop for a normal game. 
     """
     init_colors()
+    set_cursor(0)
+    geom = compute_geometry(stdscr, cell_width, cell_height)
+    # Pieces as they were last drawn; None forces a full redraw
+    prev_piece_map = None
+    # The terminal is only measured again after getch() reports KEY_RESIZE
+    resized = False
+    # Input typed before a resize interrupted it
+    typed = ""
+    # Set whenever the screen no longer shows the current state
+    dirty = True
+    # A board that doesn't fit only ends the game before it was ever shown
+    first_frame = True
     while not board.is_game_over():
-        # Decide cell sizes if None
-        height, width = stdscr.getmaxyx()
-        if cell_width is None:
-            cell_width = max(3, (width - 4) // 8)
-        if cell_height is None:
-            cell_height = max(3, (height - 4) // 8)
-
-        prompt_y = draw_board_common(stdscr, board, cell_width, cell_height)
-        if prompt_y < 0:
-            return  # Board didn't fit
-
-        # Prompt user
-        color = "White" if board.turn else "Black"
-        stdscr.addstr(prompt_y, 0, f"Enter {color}'s move (e.g., e4):")
-        stdscr.clrtoeol()
-        stdscr.refresh()
-        
+        if resized:
+            geom = compute_geometry(stdscr, cell_width, cell_height)
+            prev_piece_map = None
+            dirty = True
+            resized = False
+
+        if dirty:
+            # Prompt user
+            color = "White" if board.turn else "Black"
+            prompt_y, prev_piece_map = draw_position(
+                stdscr, board, geom, prev_piece_map,
+                f"Enter {color}'s move (e.g., e4):")
+            if prompt_y < 0:
+                if first_frame:
+                    return  # Board didn't fit
+                # Shrunk mid-game; keep the game until the window grows again
+                wait_for_resize(geom.pad)
+                resized = True
+                continue
+            first_frame = False
+            dirty = False
+
         # Get user move
-        stdscr.move(prompt_y + 1, 0)
-        stdscr.clrtoeol()
-        curses.echo()
-        move_str = stdscr.getstr(prompt_y + 1, 0).decode('utf-8')
-        curses.noecho()
+        move_str, resized = read_move(stdscr, prompt_y + 1, geom, typed)
+        if resized:
+            # Keep the partial move and show it again after the redraw
+            typed = move_str
+            continue
+        typed = ""
 
         # Try parse
         try:
+            move_str = move_str.strip()
+            if not MOVE_SHAPE.fullmatch(move_str):
+                raise ValueError(f"not a move: {move_str!r}")
             san_move = board.parse_san(move_str)
             if san_move in board.legal_moves:
                 board.push(san_move)
             else:
-                stdscr.addstr(prompt_y + 2, 0, "Illegal move. Press any key.")
-                stdscr.refresh()
-                stdscr.getch()
+                key = show_message(stdscr, prompt_y + 2, geom, "Illegal move. Press any key.")
+                resized = key == curses.KEY_RESIZE
         except ValueError:
-            stdscr.addstr(prompt_y + 2, 0, "Invalid or unrecognized move. Press any key.")
-            stdscr.refresh()
-            stdscr.getch()
+            key = show_message(stdscr, prompt_y + 2, geom, "Invalid or unrecognized move. Press any key.")
+            resized = key == curses.KEY_RESIZE
+        # Either the move or the message has to be redrawn
+        dirty = True
 
     # Game over
-    stdscr.addstr(0, 0, "Game Over. Press any key to exit.")
-    stdscr.refresh()
-    stdscr.getch()
+    show_message(stdscr, 0, geom, "Game Over. Press any key to exit.")
 
 def draw_puzzle_game(stdscr, board, puzzle_solution, cell_width=None, cell_height=None):
     """
@@ -207,20 +543,23 @@ def draw_puzzle_game(stdscr, board, puzzle_solution, cell_width=None, cell_heigh
     - Ends when puzzle_solution is exhausted or user enters an incorrect move
     """
     init_colors()
+    set_cursor(0)
     # puzzle_solution is a list of moves in UCI format, e.g. ['d1a4','d8d7','a4e4']
     solution_index = 0
+    geom = compute_geometry(stdscr, cell_width, cell_height)
+    prev_piece_map = None
+    resized = False
+    typed = ""
+    dirty = True
+    first_frame = True
 
     # We'll keep going until we run out of solution moves
     while solution_index < len(puzzle_solution):
-        height, width = stdscr.getmaxyx()
-        if cell_width is None:
-            cell_width = max(3, (width - 4) // 8)
-        if cell_height is None:
-            cell_height = max(3, (height - 4) // 8)
-
-        prompt_y = draw_board_common(stdscr, board, cell_width, cell_height)
-        if prompt_y < 0:
-            return  # Board didn't fit
+        if resized:
+            geom = compute_geometry(stdscr, cell_width, cell_height)
+            prev_piece_map = None
+            dirty = True
+            resized = False
 
         next_move_uci = puzzle_solution[solution_index]
         next_move = chess.Move.from_uci(next_move_uci)
@@ -228,41 +567,55 @@ def draw_puzzle_game(stdscr, board, puzzle_solution, cell_width=None, cell_heigh
         # Check if it's the correct side to move for the next puzzle move.
         # If yes, prompt the user; if not, auto-play it.
         if board.turn == (board.color_at(next_move.from_square) == chess.WHITE):
-            # Prompt user
-            color_str = "White" if board.turn else "Black"
-            stdscr.addstr(prompt_y, 0, f"Puzzle: Enter {color_str}'s move in UCI (e.g. {next_move_uci}):")
-            stdscr.clrtoeol()
-            stdscr.refresh()
+            # Only draw positions the user actually has to answer
+            if dirty:
+                # Prompt user
+                color_str = "White" if board.turn else "Black"
+                prompt_y, prev_piece_map = draw_position(
+                    stdscr, board, geom, prev_piece_map,
+                    f"Puzzle: Enter {color_str}'s move in UCI (e.g. {next_move_uci}):")
+                if prompt_y < 0:
+                    if first_frame:
+                        return  # Board didn't fit
+                    wait_for_resize(geom.pad)
+                    resized = True
+                    continue
+                first_frame = False
+                dirty = False
 
             # Get user input
-            stdscr.move(prompt_y + 1, 0)
-            stdscr.clrtoeol()
-            curses.echo()
-            move_str = stdscr.getstr(prompt_y + 1, 0).decode('utf-8')
-            curses.noecho()
+            move_str, resized = read_move(stdscr, prompt_y + 1, geom, typed)
+            if resized:
+                typed = move_str
+                continue
+            typed = ""
 
             # Compare to puzzle_solution[solution_index]
             if move_str.strip().lower() == next_move_uci:
                 # It's correct, so push it on the board
                 board.push(next_move)
                 solution_index += 1
+                dirty = True
             else:
                 # Wrong!
-                stdscr.addstr(prompt_y + 2, 0, 
+                show_message(stdscr, prompt_y + 2, geom,
                     f"Incorrect move. The puzzle solution expects {next_move_uci}. Press any key.")
-                stdscr.refresh()
-                stdscr.getch()
                 return
         else:
             # Opponent move; auto-play it
             board.push(next_move)
             solution_index += 1
+            dirty = True
 
     # If we exit the loop, puzzle_solution is done => success
-    draw_board_common(stdscr, board, cell_width, cell_height)
-    stdscr.addstr(0, 0, "Puzzle solved! Press any key to exit.")
-    stdscr.refresh()
-    stdscr.getch()
+    draw_board_common(
+        stdscr, board, geom, changed_squares(board.piece_map(), prev_piece_map))
+    show_message(stdscr, 0, geom, "Puzzle solved! Press any key to exit.")
+
+# Shared HTTP session, so repeated puzzle fetches reuse one connection
+# to lichess.org instead of paying for a new TCP and TLS handshake.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
 def load_random_puzzle():
     """
@@ -271,7 +624,7 @@ def load_random_puzzle():
     plus the puzzle's solution in UCI list form.
     """
     url = "https://lichess.org/api/puzzle/next"
-    response = requests.get(url, timeout=10)
+    response = SESSION.get(url, timeout=10)
     data = response.json()
 
     puzzle_data = data["puzzle"]
@@ -286,14 +639,12 @@ def load_random_puzzle():
     game = chess.pgn.read_game(pgn_io)
     board = game.board()
 
-    # The game.mainline_moves() is a generator of all moves.
-    moves = list(game.mainline_moves())
-    
     # Push exactly initial_ply - 1 moves (so that the puzzle starts at move #initialPly).
-    # Also make sure we don't exceed the total length of the PGN.
-    to_push = min(max(initial_ply - 1, 0), len(moves))
-    for i in range(to_push):
-        board.push(moves[i])
+    # game.mainline_moves() is consumed lazily, so the rest of the game is never
+    # walked and a short PGN simply runs out early.
+    to_push = max(initial_ply - 1, 0)
+    for move in islice(game.mainline_moves(), to_push):
+        board.push(move)
 
     return board, puzzle_solution
 
@@ -320,8 +671,6 @@ def main(pgn_file=None, puzzle_mode=False, cell_width=None, cell_height=None):
 
 
 if __name__ == "__main__":
-    import sys
-
     # Very simplistic command-line handling
     # e.g. "python puzzle_tui.py puzzle" to run puzzle mode
     # e.g. "python puzzle_tui.py mygame.pgn" to load a PGN
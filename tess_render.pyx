@@ -0,0 +1,33 @@
+# cython: language_level=3
+"""
+Compiled version of tess.draw_frame, the loop behind every full redraw.
+
+Build it next to tess.py with:
+
+    cythonize -i tess_render.pyx
+
+tess.py picks it up automatically and falls back to the pure Python
+draw_frame when it isn't built.
+"""
+
+cpdef draw_frame(object pad, tuple background, tuple attr_runs, list placements):
+    cdef list row_chars = [bytearray(row) for row in background]
+    cdef bytearray chars
+    cdef bytes clipped
+    cdef tuple rows, runs
+    cdef Py_ssize_t x, y, start, row_idx, run_length, offset_x, offset_y
+    cdef object attr
+    cdef object addstr = pad.addstr
+
+    for x, y, (offset_x, offset_y, rows) in placements:
+        start = x + offset_x
+        for row_idx in range(len(rows)):
+            clipped = rows[row_idx]
+            chars = row_chars[y + offset_y + row_idx]
+            chars[start:start + len(clipped)] = clipped
+
+    for y in range(len(row_chars)):
+        chars = row_chars[y]
+        runs = attr_runs[y]
+        for x, run_length, attr in runs:
+            addstr(y, x, bytes(chars[x:x + run_length]), attr)